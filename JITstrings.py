@@ -141,9 +141,11 @@ class JITstring(object):
         self.static_text += prepend + line
         self.cmds += cmds
 
-    def __repr__(self):
-        if type(self.cmds) != list:
-            return str(self.static_text).format(*self.cmds())
-        return self.static_text.format(*self.cmds)
+    def render(self) -> str:
+        """Formats the current results of the commands into the static text."""
+        cmds = self.cmds
+        return self.static_text.format(*(cmds if isinstance(cmds, list) else cmds()))
 
-    def __call__(self): return self.__repr__()
+    def __repr__(self): return self.render()
+
+    def __call__(self): return self.render()
@@ -11,3 +11,16 @@ elif sys.platform == "win32":
 elif sys.platform == "darwin":
     pass
 
+
+def __getattr__(name: str):
+    # GraphWidget and VisualizerWidget are loaded on first use, see pywidgets.widgets.__getattr__.
+    # Like there, `from pywidgets import *` leaves them out; use pywidgets.GraphWidget or import them by name
+    from pywidgets import widgets
+    if name in widgets._graph_widgets: return getattr(widgets, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    from pywidgets import widgets
+    return sorted([*globals(), *widgets._graph_widgets])
+
@@ -0,0 +1,170 @@
+from typing import Callable, Sequence
+from PyQt6.QtWidgets import QWidget, QGraphicsItem, QGraphicsPathItem
+from PyQt6.QtGui import QPen
+from pywidgets.JITstrings import JITstring
+from pywidgets.widgets import WidgetTimer
+import pyqtgraph as pg
+import numpy as np
+
+
+class _MultiLine(QGraphicsPathItem):
+    def __init__(self, pen: QPen, rows: list[int], points: int):
+        """Several lines of a GraphWidget drawn with the same pen, built into a single path.
+        :param pen: the pen to draw the lines with.
+        :param rows: which rows of the graph's data this item draws.
+        :param points: the number of samples in each line.
+        """
+        super().__init__()
+        self.setPen(pen)
+        self.rows = rows
+        self._xs = np.tile(np.arange(points, dtype=np.float32), len(rows))
+        self._connect = np.ones(points * len(rows), np.bool_)
+        self._connect[points - 1::points] = False  # don't join the end of one line to the start of the next
+
+    def setData(self, ys: np.ndarray):
+        self.setPath(pg.arrayToQPath(self._xs, ys[self.rows].ravel(), connect=self._connect))
+
+
+class GraphWidget(pg.PlotWidget):
+    def __init__(self, parent: QWidget, title: JITstring | str, getdata: Callable[[], float] | Callable[[], Sequence[float]],
+                 height: int = -1, update_interval: int = 500, time_span: int = 60000, yrange: tuple[float, float] | None = (0, 100),
+                 ylabel_str_fn: Callable[[float], str] = str, linecolor=None,
+                 linecolors: None | Sequence = None, linewidth: float = None, lines: int = 1):
+        """
+        A widget showing a graph with time as the x-axis and a title.
+        :param parent: the parent widget of this widget, usually the main window.
+        :param title: the title for the graph.
+        :param getdata: a function or command that returns numerical data.
+        :param height: the height of the widget in pixels. Set to None for responsive, and -1 to automatically set fixed height (default).
+        :param update_interval: how often (in ms) the graph should update.
+        :param time_span: the range in ms for the x-axis.
+        :param yrange: the range for the y-axis, as a tuple with (bottom, top).
+        :param ylabel_str_fn: a function returning the labels for the y-axis. Must take a y value and return a str.
+        :param linecolor: the color of the graph's line. Can be (R,G,B,[A]) tuple (values from 0-255), "#RGB" or "#RRGGBBAA" hex strings, QColor, etc.
+            See documentation for pyqtgraph.mkColor() for all options. Leave as None to use the parent widget's default color.
+        :param linecolors: can only use if lines > 1 and linecolor is None. Must be a list containing colors in the same format as linecolor,
+            in the same order as the data returned by getdata.
+        :param linewidth: the width of the line.
+        :param lines: how many lines to be drawn - if greater than 1, getdata must return a list of the multiple line data.
+        """
+        super().__init__(parent=None, background=None)
+        self.setProperty('transparentBackground', True)  # see pywidgets.widgets._app_stylesheet
+        if height == -1: height = round(parent.screen().availableGeometry().height()/10)
+        if height is not None: self.setFixedHeight(height)
+        self.graph_title = title
+        default_color = self.palette().window().color()  # use parent palette because the PlotWidget sets its own
+        text_color = self.palette().windowText().color()
+        if linecolor is None and linecolors is None: linecolor = default_color
+        elif linecolors is not None:
+            if linecolor is not None:
+                raise AssertionError("linecolor and linecolors arguments to GraphWidget cannot both be given; change one to None.")
+            if lines == 1:
+                raise AssertionError(f"linecolors argument to GraphWidget can only be used with multiple lines - you gave lines={lines}")
+        points = len(range(0, time_span, update_interval))  # x values are just the sample indices, pyqtgraph's default
+        # ring buffer where every sample is written twice, N apart, so the last N samples are always a contiguous view
+        self._buf = np.zeros(2 * points if lines == 1 else (lines, 2 * points), np.float32)
+        self._points = points
+        self._head = 0  # index the next sample is written to
+        self._flat = points  # how many samples in a row have repeated the one before, see update_plot_data()
+        self.ys = self._buf[..., :points]  # the current samples, oldest first
+        self.update_interval = update_interval
+        self.getdata = getdata
+        self.lines = lines
+        self.setTitle(title, size=f"{self.fontInfo().pixelSize()}px", color=text_color)
+        self.getPlotItem().titleLabel.item.setFont(self.font())
+        bott = self.getAxis('bottom')
+        bott.setStyle(showValues=False, tickLength=0, tickAlpha=0)
+        bott.setPen(color=default_color)
+        left = self.getAxis('left')
+        left.setStyle(tickLength=0, tickAlpha=0, hideOverlappingLabels=False, tickFont=self.font())
+        left.setPen(color=default_color)
+        left.setTextPen(color=text_color)
+        self.setXRange(0, points - 1, padding=0)  # method is overloaded by pg.ViewBox one at runtime, ignore IDE warning
+        if yrange:
+            dy = yrange[1] - yrange[0]
+            num_ticks = 5
+            tick_offset = 0.06  # % of y-axis to move the tick labels upwards by (causes imprecision in the middle labels)
+            tickstrs = [ylabel_str_fn(v) for v in np.linspace(0, dy, num_ticks).tolist()]
+            ticks = ((np.linspace(0, 1 - tick_offset, num_ticks) + tick_offset) * dy).tolist()
+            self.getAxis('left').setTicks([list(zip(ticks, tickstrs)), []])
+            self.setYRange(*yrange, padding=0)
+
+        if lines == 1:
+            pen = pg.mkPen(color=linecolor) if linewidth is None else pg.mkPen(color=linecolor, width=linewidth)
+            self.data_line = self.plot(self.ys, pen=pen, skipFiniteCheck=True)
+            self.data_line.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        else:
+            pens = [pg.mkPen(color=color) if linewidth is None else pg.mkPen(color=color, width=linewidth)
+                    for color in (linecolors if linecolors is not None else [linecolor] * lines)]
+            groups: dict[tuple[int, float], list[int]] = {}  # lines sharing a pen are drawn together as one path
+            for i, pen in enumerate(pens): groups.setdefault((pen.color().rgba(), pen.widthF()), []).append(i)
+            self.path_items = []  # one per pen
+            # still indexed by line like the old per-line PlotDataItems, but each entry is the path item drawing that line,
+            # shared with every other line using the same pen: setPen() affects them all, and setData() takes all rows
+            self.data_lines: list[_MultiLine] = [None] * lines
+            for rows in groups.values():
+                line = _MultiLine(pens[rows[0]], rows, points)
+                line.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+                line.setData(self.ys)
+                self.addItem(line)
+                self.path_items.append(line)
+                for row in rows: self.data_lines[row] = line
+        self.timer = WidgetTimer(self.update_plot_data, update_interval)
+
+    def update_plot_data(self):
+        data = float(self.getdata()) if self.lines == 1 else self.getdata()
+        head, points = self._head, self._points
+        self._buf[..., head] = self._buf[..., head + points] = data
+        # compared after storing, so both sides are float32. head - 1 wraps to the last column, which mirrors the previous sample
+        self._flat = self._flat + 1 if np.array_equal(self._buf[..., head], self._buf[..., head - 1]) else 0
+        self._head = head = (head + 1) % points
+        self.ys = self._buf[..., head:head + points]  # a view, nothing is copied
+        if self._flat >= points: return  # every visible sample was already the same value, so scrolling changes nothing
+        if self.lines == 1: self.data_line.setData(self.ys)
+        else:
+            for line in self.path_items: line.setData(self.ys)
+
+
+class VisualizerWidget(pg.PlotWidget):
+    def __init__(self, parent: QWidget, getdata: Callable[[], Sequence[float]], yrange: tuple = None, linecolor=None,
+                 linewidth: float = None, update_interval: int = 500):
+        """A mirrored line graphing the output of getdata with no axes, labels, or title. Meant to be used in other widgets.
+        :param parent: the parent widget of this widget.
+        :param getdata: a function or PyCmd that returns a list of floats. The length of the list should be the same each call;
+            changing it works, but reallocates the graph's buffers.
+        :param yrange: the range for the y-axis, as a tuple with (bottom, top).
+        :param linecolor: the color of the graph's line. Can be (R,G,B,[A]) tuple (values from 0-255), "#RGB" or "#RRGGBBAA" hex strings, QColor, etc.
+            See documentation for pyqtgraph.mkColor() for all options. Leave as None to use the parent widget's default color.
+        :param linewidth: the width of the line.
+        :param update_interval: how often get_data should be called and the graph updated."""
+        super().__init__(parent)
+        if linecolor is None: linecolor = self.palette().window().color()
+        ys = np.fromiter(getdata(), np.float32)
+        pen = pg.mkPen(color=linecolor) if linewidth is None else pg.mkPen(color=linecolor, width=linewidth)
+        self.getdata = getdata
+        self.update_interval = update_interval
+        self.setProperty('transparentBackground', True)
+        for axis in ('bottom', 'left'):
+            self.hideAxis(axis)
+
+        self._set_length(len(ys))
+        if yrange: self.setYRange(*yrange, padding=0)
+
+        self.data_lines = self.plot(self.xs, ys, pen=pen), self.plot(self.xs, -ys, pen=pen)
+        self.timer = WidgetTimer(self.update_plot_data, update_interval)
+
+    def _set_length(self, n: int):
+        """Allocates the x values and the reused data buffers for n points and fits the x-axis to them."""
+        self._n = n
+        self.xs = np.arange(n)
+        self._ys_buf = np.empty(n, np.float32)  # reused every update, see update_plot_data()
+        self._neg_buf = np.empty_like(self._ys_buf)
+        self.setXRange(0, n - 1, padding=0)
+
+    def update_plot_data(self):
+        data = self.getdata()
+        if len(data) != self._n: self._set_length(len(data))  # slow path, the length is normally fixed
+        self._ys_buf[:] = data  # converted straight into the reused buffer, no temporary array
+        np.negative(self._ys_buf, out=self._neg_buf)
+        self.data_lines[0].setData(self.xs, self._ys_buf)
+        self.data_lines[1].setData(self.xs, self._neg_buf)
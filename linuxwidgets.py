@@ -89,7 +89,8 @@ class MediaWidget(_MediaFramework):
         self.update_player(self.data_proxy.call("Get", "org.mpris.MediaPlayer2", "Identity").arguments()[0])
 
         self.can_control = self.data_proxy.call("Get", "org.mpris.MediaPlayer2.Player", "CanControl").arguments()[0]
-        if not self.can_control: self.ctrllayout.hide()
+        if not self.can_control:
+            for but in self.buttons: but.hide()
         self.can_raise = self.data_proxy.call("Get", "org.mpris.MediaPlayer2", "CanRaise").arguments()[0]
         if self.playing: self.played()
 
@@ -127,10 +128,6 @@ class MediaWidget(_MediaFramework):
         self.set_art(art)
         resp.deleteLater()  # required, not managed by Qt
 
-    def set_art(self, art: QPixmap):
-        self.imglabel.setPixmap(art)
-        self.imglabel.show()
-
     @QtCore.pyqtSlot("QString", "QVariantMap", "QStringList")
     def properties_changed(self, interface, changed_properties,
                            invalidated_properties=None):
@@ -12,7 +12,8 @@ background_color = None  # use RGBA tuple to specify, eg (0,0,0,128) for half op
 use_async = cur_OS == 'Windows'
 if use_async:
     import importlib.util
-    use_async = importlib.util.find_spec("qtinter") is not None  # use async iff on windows and qtinter is installed
+    # use async iff on windows and an integration is installed - qasync first, like pywidgets.start()
+    use_async = any(importlib.util.find_spec(name) is not None for name in ("qasync", "qtinter"))
 
 window = pywidgets.Window(background_color=background_color, use_async=use_async, shadow_radius=8)
 
@@ -24,7 +25,8 @@ window.add_widget(pywidgets.HrWidget(window))
 if hasattr(pywidgets, "MediaListWidget"):  # currently only Linux and Windows versions written
     window.add_widgets([pywidgets.MediaListWidget(window), pywidgets.HrWidget(window)])
 
-blkstr = PyCmd(lambda: pywidgets.html_table([[disk_cmds['shrink path'](p), '{} / {}'] for p in disk_cmds['disks mountpoint']]).format(
+disk_table = pywidgets.HTMLTableRenderer()  # rebuilt every update, so reuse the rows that haven't changed
+blkstr = PyCmd(lambda: disk_table([[disk_cmds['shrink path'](p), '{} / {}'] for p in disk_cmds['disks mountpoint']]).format(
     *[i for l in zip(disk_cmds['disks used'], disk_cmds['disks total']) for i in l]))
 
 window.add_widgets(
@@ -0,0 +1,31 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))  # the pywidgets parent
+pytest.importorskip("PyQt6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtCore import QCoreApplication
+from pywidgets import widgets
+
+app = QCoreApplication.instance() or QCoreApplication([])
+
+
+def test_zero_interval_gets_its_own_timer():
+    hundred = widgets.shared_timer(100)
+    zero = widgets.shared_timer(0)
+    assert zero.hub is not hundred.hub
+    assert zero.multiple == 1 and hundred.multiple == 1
+    assert zero.hub.interval() == 0
+    zero.hub._tick()  # would raise ZeroDivisionError if 0 had been merged into the 100 ms timer
+    assert widgets.shared_timer(50).hub is hundred.hub  # positive intervals still merge, ignoring the 0 ms timer
+    assert zero.hub is not hundred.hub and zero.hub.interval() == 0
+    assert widgets.shared_timer(0) is zero
+
+
+@pytest.mark.parametrize("interval", [-1, -100])
+def test_negative_interval_is_rejected(interval):
+    hubs = dict(widgets._shared_timers)
+    with pytest.raises(ValueError):
+        widgets.shared_timer(interval)
+    assert widgets._shared_timers == hubs  # no running timer was taken over
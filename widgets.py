@@ -1,31 +1,54 @@
 import os
+import logging
+from functools import lru_cache
+from weakref import WeakSet
 from typing import Callable, Sequence, Self
-from PyQt6 import QtWidgets
+from PyQt6 import QtWidgets, sip
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QTimer, QPoint, QRect, pyqtSlot, QSize
-from PyQt6.QtGui import QPainter, QPen, QColor, QScreen, QResizeEvent, QPalette, QAction, QPixmap, QPainterPath, QIcon
+from PyQt6.QtCore import Qt, QTimer, QPoint, QRect, pyqtSlot, pyqtSignal, QSize, QEvent, QObject
+from PyQt6.QtGui import QPainter, QPen, QColor, QScreen, QResizeEvent, QPalette, QAction, QPixmap, QBrush
 from PyQt6.QtSvg import QSvgRenderer
 from pywidgets.JITstrings import JITstring, PyCmd
-import pyqtgraph as pg
-import numpy as np
 
 try:
-    import asyncio, qtinter  # optional, only required for certain widgets that use async (windows media widget, etc)
+    import asyncio  # optional, only required for certain widgets that use async (windows media widget, etc)
     from asyncio import Task, sleep
+    try: import qasync  # runs asyncio on Qt's own event dispatcher, so it's preferred over qtinter
+    except ImportError: qasync = None
+    qtinter = None
+    if qasync is None: import qtinter
 
-    loop: qtinter.QiProactorEventLoop | None = None
-except ImportError: asyncio, qtinter, loop = None, None, None
+    loop: asyncio.AbstractEventLoop | None = None
+except ImportError: asyncio, qasync, qtinter, loop = None, None, None, None
 _use_async = False
 _app: QtWidgets.QApplication | None = None
+_default_app_args = ["PyWidgets"]
+_shared_timers: dict[int, QTimer] = {}  # the running timers, by interval. See shared_timer()
+_tickers: dict[int, QObject] = {}  # every interval handed out by shared_timer(), by interval
+_widget_timers: WeakSet = WeakSet()  # every WidgetTimer, so a Window can pause the ones belonging to its widgets
+_alignments = {name[5:]: flag for name, flag in Qt.AlignmentFlag.__members__.items()}  # ie "Center" -> AlignCenter
+_pen_cache: dict[tuple[int, int], QPen] = {}  # see cached_pen()
+_startup_queue: list[PyCmd] = []  # see run_on_app_start()
+_cleanup_widgets: WeakSet[QWidget] = WeakSet()  # widgets with a handle_removed() to call on exit, see Window
+# rules shared by all widgets, parsed once by the QApplication instead of per widget. Select widgets by dynamic property or objectName
+_app_stylesheet = '''
+    *[transparentBackground="true"] { background-color: transparent; }
+    QMenu#right_click_menu::item { padding: 2% 15%;
+                                   border-bottom: 1px solid; }
+    QMenu#right_click_menu::item:selected { border: 2px solid; }
+'''
 
 
 class Window(QtWidgets.QMainWindow):
     default_stylesheet = "font-family: Inter, Helvetica, Roboto, sans-serif;"
+    _background_rule = '#main_widget {{ background-color: rgba({}); }}'  # formatted with background_color
     default_palette = QPalette()
     default_palette.setColor(QPalette.ColorRole.Window, QColor('grey'))
     default_palette.setColor(QPalette.ColorRole.WindowText, QColor('grey'))
     default_palette.setColor(QPalette.ColorRole.Light, QColor('white'))
     default_palette.setColor(QPalette.ColorRole.Shadow, QColor('black'))
+    _position_flags = {'bottom': Qt.WindowType.Tool | Qt.WindowType.WindowStaysOnBottomHint,
+                       'top': Qt.WindowType.Tool | Qt.WindowType.WindowStaysOnTopHint}
 
     def __init__(self, font_size_vh: float = 1.0, stylesheet: str = "default", palette: QPalette = None,
                  background_color: tuple[int, int, int, int] = None, maintain_position: str = "bottom",
@@ -56,9 +79,14 @@ class Window(QtWidgets.QMainWindow):
 
         # get (or start) application and initialize window
         global _app
-        if _app is None:  # start application if it's not running
-            _app = QtWidgets.QApplication(["PyWidgets"] if not application_flags else application_flags)
+        if _app is None:  # start application if it's not running, reusing one that was created outside pywidgets
+            _app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(application_flags or _default_app_args)
+            _app.setStyleSheet(_app.styleSheet() + _app_stylesheet)  # keep any stylesheet an existing app already had
         super().__init__() if window_flags is None else super().__init__(flags=window_flags)
+        self._resize_timer = QTimer(self)  # collapses bursts of resize events into one handle_resize, see resizeEvent()
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self.handle_resize)
 
         if use_async:  # set up the loop to be assigned as Qt's first task, so other widgets can reference it
             global _use_async
@@ -86,44 +114,36 @@ class Window(QtWidgets.QMainWindow):
         # setup style of window
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setWindowTitle("PyWidgets")
-        types = Qt.WindowType
-        flags = types.FramelessWindowHint
-        if maintain_position.lower() == 'bottom': flags = flags | types.Tool | types.WindowStaysOnBottomHint
-        elif maintain_position.lower() == 'top': flags = flags | types.Tool | types.WindowStaysOnTopHint
+        flags = Qt.WindowType.FramelessWindowHint
+        position_flags = self._position_flags.get(maintain_position.lower())  # anything else behaves like "default"
+        if position_flags is not None: flags = flags | position_flags
         self.setWindowFlags(flags)
 
         if stylesheet == 'default':  stylesheet = self.default_stylesheet
-        self.setStyleSheet(stylesheet)
+        if stylesheet: self.setStyleSheet(stylesheet)  # scoped to this window, the shared rules are in _app_stylesheet
         if palette is None: palette = self.default_palette
         _app.setPalette(palette)
-        self.style().polish(self)  # force the stylesheet to be handled now before initializing widgets for proper inheritance
+        if stylesheet: self.style().polish(self)  # handle the stylesheet now before initializing widgets for proper inheritance
+        if background_color is not None:  # on this window's main_widget, so each Window can have its own
+            self.main_widget.setStyleSheet(self._background_rule.format(','.join(map(str, background_color))))
 
-        if background_color is not None:
-            self.main_widget.setStyleSheet('#main_widget {background-color: rgba(' + ','.join(background_color) + ');}')
-
-        if shadow_radius:  # shadow effect burns in on plotwidget static elements
-            sw = self.main_widget
-            shadow = QtWidgets.QGraphicsDropShadowEffect(sw)
-            shadow.setColor(self.palette().shadow().color())
-            shadow.setOffset(0)
-            shadow.setBlurRadius(shadow_radius)
-            sw.setGraphicsEffect(shadow)
+        self.shadow_radius = shadow_radius  # applied to each widget placed in main_widget, see eventFilter()
+        if shadow_radius: self.main_widget.installEventFilter(self)
 
         self.setSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Expanding)
 
         # context menu setup
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.right_click_menu = QtWidgets.QMenu(self)
-        self.right_click_menu.setStyleSheet('''
-            QMenu::item { padding: 2% 15%;
-                          border-bottom: 1px solid;}
-            QMenu::item:selected {border: 2px solid;}
-        ''')
+        self.right_click_menu.setObjectName("right_click_menu")  # styled by _app_stylesheet
         self.customContextMenuRequested.connect(self.right_click_performed)
         refresh_action = QAction("Refresh", self)
         refresh_action.triggered.connect(self.handle_resize)
         self.right_click_menu.addAction(refresh_action)
         self.move_screen_menu = self.right_click_menu.addMenu("Move to Screen")
+        self._rebuild_screens_menu()
+        _app.screenAdded.connect(self._rebuild_screens_menu)
+        _app.screenRemoved.connect(self._rebuild_screens_menu)
         exit_action = QAction("Exit", self)
         exit_action.triggered.connect(self.exit_clicked)
         self.right_click_menu.addAction(exit_action)
@@ -132,15 +152,29 @@ class Window(QtWidgets.QMainWindow):
 
     def resizeEvent(self, a0: QResizeEvent | None):
         if a0: super().resizeEvent(a0)
-        self.handle_resize()
+        self._resize_timer.start()  # handle_resize itself resizes the window, so wait until the events settle
+
+    def hideEvent(self, a0):
+        super().hideEvent(a0)
+        self._pause_timers(True)  # nothing's visible, so stop polling for updates
+
+    def showEvent(self, a0):
+        super().showEvent(a0)
+        self._pause_timers(False)
+
+    def _pause_timers(self, paused: bool) -> None:
+        """Pauses or resumes the update timers of this window's widgets only, so other Windows keep updating."""
+        for timer in list(_widget_timers):
+            widget = timer.widget
+            if widget is not None and not sip.isdeleted(widget) and widget.window() is self: timer.pause(paused)
 
     def set_size(self: Self, dims: QRect) -> None:
-        width = round(dims.width() * 17 / 128)  # a bit wider than 1/8th of the screen. 4K->510px
+        x, y, w, h = dims.x(), dims.y(), dims.width(), dims.height()  # read all geometry first, then apply it at once
+        width = round(w * 17 / 128)  # a bit wider than 1/8th of the screen. 4K->510px
         offset = 0  # the amount to move the window left, for better visibility
-        self.setFixedWidth(width)
-        #self.setMaximumHeight(dims.height())  # disabled for now, see next line
-        self.setFixedHeight(dims.height())  # QT doesn't handle resizing on wayland yet, so just take all the height
-        self.move(dims.x() + dims.width() - width - offset, dims.y())
+        #self.setMaximumHeight(h)  # disabled for now, see next line
+        self.setFixedSize(width, h)  # QT doesn't handle resizing on wayland yet, so just take all the height
+        self.move(x + w - width - offset, y)
 
     @pyqtSlot()
     def exit_clicked(self, *args):
@@ -150,16 +184,19 @@ class Window(QtWidgets.QMainWindow):
 
     @pyqtSlot(QPoint)
     def right_click_performed(self, a0: QPoint):
-        self.move_screen_menu.clear()
+        self.right_click_menu.popup(self.mapToGlobal(a0))
+
+    def _rebuild_screens_menu(self, *_args):
+        """Fills the "Move to Screen" menu with the current screens. Only runs when a screen is added or removed."""
+        self.move_screen_menu.clear()  # also deletes the old actions, since the menu owns them
         for screen in _app.screens():
-            act = QAction(screen.name(), self)
+            act = QAction(screen.name(), self.move_screen_menu)
             act.triggered.connect(PyCmd(self.handle_resize, screen))
             self.move_screen_menu.addAction(act)
-        self.right_click_menu.popup(self.mapToGlobal(a0))
 
     def handle_removed(self):
-        for widget in QtWidgets.QApplication.allWidgets():
-            if widget is not self and hasattr(widget, 'handle_removed'): widget.handle_removed()
+        """Calls handle_removed() on every widget registered with register_cleanup(), before the window closes."""
+        for widget in list(_cleanup_widgets): widget.handle_removed()  # copied, since handlers can drop widgets
 
     def add_widget(self, widget, *args) -> None:
         """
@@ -175,20 +212,39 @@ class Window(QtWidgets.QMainWindow):
         :param widgets: Either a list of widgets, or a list of lists of the format [[widget, *args], ...]
         """
         for widget in widgets:
-            if not hasattr(widget, '__next__'): self.widgets.append((widget, ))  # if it's not iterable, wrap in tuple
-            else: self.widgets.append(widget)  # if 'widget' is iterable, assuming it matches the [widget, *args] format
+            if isinstance(widget, QWidget): self.widgets.append((widget, ))  # a lone widget, wrap in tuple
+            else: self.widgets.append(tuple(widget))  # otherwise assume it matches the [widget, *args] format
+
+    def eventFilter(self, a0, a1) -> bool:
+        # every widget that ends up directly in main_widget gets a shadow, however it was added to the layout
+        if a1.type() == QEvent.Type.ChildPolished and a0 is self.main_widget:
+            child = a1.child()
+            if child.isWidgetType() and child.graphicsEffect() is None: self.add_shadow(child)
+        return super().eventFilter(a0, a1)
+
+    def add_shadow(self, widget: QWidget) -> None:
+        """
+        Gives a widget its own shadow (outline), so a repaint only re-blurs that widget instead of the whole window.
+        :param widget: the widget to add the shadow behind.
+        """
+        shadow = QtWidgets.QGraphicsDropShadowEffect(widget)  # shadow effect burns in on plotwidget static elements
+        shadow.setColor(self.palette().shadow().color())
+        shadow.setOffset(0)
+        shadow.setBlurRadius(self.shadow_radius)
+        widget.setGraphicsEffect(shadow)
 
     def handle_resize(self, screen: QScreen = None, _signal: bool = None):
         """Resize and reconfigure the Window, optionally on a specific screen. Uses the geometry from the get_geometry
         argument in Window's init.
         :param screen: The QScreen to use for display, or None for the current one.
         :param _signal: the signal of the menuitem that's passed along when clicked; ignored."""
-        if type(screen) == bool: screen = None  # if called from the right click menu, sends a bool
+        if isinstance(screen, bool): screen = None  # if called from the right click menu, sends a bool
         if screen is not None: self.setScreen(screen)
         dims = self.screen().availableGeometry()
         font = self.font()
         newsize = round(self.font_size_vh / 100 * dims.height())
-        if newsize != font.pixelSize():
+        oldsize = font.pixelSize()  # -1 until pywidgets sets it the first time
+        if abs(newsize - oldsize) >= max(1, round(oldsize * .05)):  # ignore tiny changes, ie an auto-hiding taskbar
             font.setPixelSize(newsize)
             _app.setFont(font)  # set font on the whole app, so it propagates downward.
         self.set_size(dims)
@@ -205,10 +261,12 @@ class Window(QtWidgets.QMainWindow):
             layout = QtWidgets.QVBoxLayout()
             layout.setContentsMargins(0, 0, 0, 0)
         self.main_widget.setLayout(layout)
-        for widget in self.widgets: layout.addWidget(*widget)
+        for widget in self.widgets:
+            layout.addWidget(*widget)
+            if hasattr(widget[0], 'handle_removed'): register_cleanup(widget[0])  # the widgets given to the window
         if spacing is not None: layout.setSpacing(spacing)
         if add_stretch: layout.addStretch(1)
-        self.screen().geometryChanged.connect(self.handle_resize)
+        self.screen().geometryChanged.connect(self._resize_timer.start)  # coalesced with resize events, see resizeEvent()
         self.show()
 
     @classmethod
@@ -217,10 +275,32 @@ class Window(QtWidgets.QMainWindow):
         start()
 
 
-class ArcsWidget(QWidget):
+class _FontSizes:
+    """Mixin for QWidgets that read their font metrics often. Subclasses set self._font_sizes = None in __init__."""
+    __slots__ = ()
+
+    def changeEvent(self, a0: QEvent):
+        super().changeEvent(a0)
+        if a0.type() == QEvent.Type.FontChange: self._font_sizes = None
+
+    def font_sizes(self) -> tuple[int, int, int]:
+        """The (height, line spacing, underline position) of this widget's font, cached until the font changes."""
+        if self._font_sizes is None:
+            fm = self.fontMetrics()
+            self._font_sizes = fm.height(), fm.lineSpacing(), fm.underlinePos()
+        return self._font_sizes
+
+
+class ArcsWidget(_FontSizes, QWidget):
+    __slots__ = ('arc_size_perc', 'percs', '_fetch', 'percent', '_spans16', 'arccol', 'arcstart', 'arcspan', '_start16',
+                 '_span16', 'arcthic_perc', '_arcthic', 'arcspace_perc', 'arcspace', '_pen_thin', '_pen_thick', '_geometry',
+                 '_bounds', '_geometry_key', '_bg_pixmap', 'antialias', 'update_interval', 'timer',
+                 '_font_sizes')  # read in every paintEvent
+
     def __init__(self, parent: QWidget, percs: Sequence[Callable[[], float]] | Callable[[], Sequence[float]],
                  percent: bool = True, size: float = 1, update_interval: int | None = 1000, arccol: QColor = None,
-                 arcthic: float = .5, arcstart: float = 270., arcspan: float = -270., arcspace: float = 1):
+                 arcthic: float = .5, arcstart: float = 270., arcspan: float = -270., arcspace: float = 1,
+                 antialias: bool = True):
         """Concentric arcs showing the percentage of each of the items in percs. The first item in the list is the outermost arc.
         :param parent: the parent widget of this widget, usually the main window.
         :param percs: either a list of commands or a single function/command that produces a list. Results must match the percent argument.
@@ -232,25 +312,37 @@ class ArcsWidget(QWidget):
         :param arcstart: the angle in degrees to start drawing the arc at, relative to the x-axis and moving counter-clockwise.
         :param arcspan: the angle in degrees the arc should span in total; positive moves counter-clockwise.
         :param arcspace: the spacing between the centers of each arc, in decimal percentage of the space between text lines (1 = 100%).
+        :param antialias: whether to antialias the arcs. Turning it off is faster but looks rougher, especially for thick arcs.
         """
         super().__init__(parent)
         self.arc_size_perc = size
         self.percs = percs
         self.percent = percent
-        self._percs_now = None
         self.arccol = self.palette().window().color() if arccol is None else arccol
         self.arcstart = arcstart
         self.arcspan = arcspan
+        self._start16, self._span16 = round(arcstart * 16), round(arcspan * 16)  # Qt arc angles are in 1/16ths of a degree
+        # turns the values straight into drawArc spans in one pass, with the list/command and percent checks decided once
+        scale = self._span16 / (100 if percent else 1)
+        if isinstance(percs, Sequence): self._fetch = lambda: [round(float(cmd()) * scale) for cmd in self.percs]
+        else: self._fetch = lambda: [round(float(i) * scale) for i in self.percs()]
+        self._spans16: list[int] = []  # see do_cmds()
         self.arcthic_perc = arcthic
-        self.arcthic = None
+        self._arcthic = None  # see the arcthic property
         self.arcspace_perc = arcspace
         self.arcspace = None
+        self.antialias = antialias
+        self._pen_thin: QPen | None = None  # built whenever arcthic is set, see _make_pens()
+        self._pen_thick: QPen | None = None
+        self._geometry: list[tuple[int, int]] = []  # see _arc_geometry()
+        self._bounds: list[QRect] = []
+        self._geometry_key = None
+        self._bg_pixmap: QPixmap | None = None  # the background arcs, see _background()
+        self._font_sizes: tuple[int, int, int] | None = None  # see font_sizes()
 
         if update_interval:
             self.update_interval = update_interval
-            self.timer = QTimer()
-            self.timer.timeout.connect(self.do_cmds)
-            self.timer.start(self.update_interval)
+            self.timer = WidgetTimer(self.do_cmds, self.update_interval)
         if self.arcthic_perc and self.arc_size_perc and self.arcspace_perc:  # if it can draw, do it.
             # otherwise, the widget manually controlling these needs to update it.
             self.adjustSize()
@@ -261,17 +353,16 @@ class ArcsWidget(QWidget):
         if self.arc_size_perc:
             size = round(self.arc_size_perc * self.parent().height())
             self.setFixedSize(size, size)
+        fonth, ls, _ = self.font_sizes()
         if self.arcthic_perc:
-            self.arcthic = round(self.fontMetrics().height() * self.arcthic_perc)
+            self.arcthic = round(fonth * self.arcthic_perc)
         if self.arcspace_perc:
-            self.arcspace = round(self.fontMetrics().lineSpacing() * self.arcspace_perc)
+            self.arcspace = round(ls * self.arcspace_perc)
 
     def do_cmds(self) -> None:
-        if isinstance(self.percs, Sequence):
-            self._percs_now = [float(i) for i in self.percs]
-        else:
-            self._percs_now = list(self.percs())
-        if self.percent: self._percs_now = [float(i)/100 for i in self._percs_now]
+        spans16 = self._fetch()
+        if spans16 == self._spans16: return  # no arc would move by even 1/16th of a degree, so don't repaint
+        self._spans16 = spans16
         self.update()
 
     def center_at(self, x: int, y: int) -> None:
@@ -279,32 +370,78 @@ class ArcsWidget(QWidget):
         offset = round(self.height() / 2)
         self.move(x - offset, y - offset)
 
+    @property
+    def arcthic(self) -> int | None:
+        """The thickness of the arcs in pixels. Setting it rebuilds the pens, so paintEvent never has to check them."""
+        return self._arcthic
+
+    @arcthic.setter
+    def arcthic(self, value: int | None) -> None:
+        if value == self._arcthic: return
+        self._arcthic = value
+        if value is not None:
+            self._make_pens()
+            self.update()
+
+    def _make_pens(self) -> None:
+        """Builds the thin (background) and thick (progress) pens for the current arc thickness."""
+        self._pen_thin = cached_pen(self.arccol, max(round(self.arcthic / 4), 1))
+        self._pen_thick = cached_pen(self.arccol, self.arcthic)
+
+    def _arc_geometry(self, n: int) -> list[tuple[int, int]]:
+        """The (offset, size) of each arc's bounding square, outermost first. Only recalculated (along with the area
+        each arc's pen covers, in _bounds) when the widget's size, the arc dimensions or the number of arcs change."""
+        key = (n, self.height(), self.arcthic, self.arcspace)
+        if key != self._geometry_key:
+            step, thic, height = 2 * self.arcspace, self.arcthic, self.height()
+            self._geometry = [(round(ioff / 2), height - ioff) for ioff in (i * step + thic for i in range(n))]
+            margin = thic // 2 + 1  # the pen is centered on the arc's bounding square, so pad it by half the pen
+            self._bounds = [QRect(ioff, ioff, arcsize, arcsize).adjusted(-margin, -margin, margin, margin)
+                            for ioff, arcsize in self._geometry]
+            self._geometry_key = key
+            self._bg_pixmap = None
+        return self._geometry
+
+    def _background(self, geometry: list[tuple[int, int]]) -> QPixmap:
+        """The thin full-span background arcs, rendered into a pixmap that's reused until the geometry changes."""
+        dpr = self.devicePixelRatioF()
+        if self._bg_pixmap is None or self._bg_pixmap.devicePixelRatioF() != dpr:
+            pixmap = QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            if self.antialias: painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(self._pen_thin)
+            for ioff, arcsize in geometry:
+                painter.drawArc(ioff, ioff, arcsize, arcsize, self._start16, self._span16)
+            painter.end()
+            self._bg_pixmap = pixmap
+        return self._bg_pixmap
+
     def paintEvent(self, event):
+        geometry = self._arc_geometry(len(self._spans16))
+        start = self._start16
+        background = self._background(geometry)
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        pen = QPen(self.arccol, max(self.arcthic // 4, 1), Qt.PenStyle.SolidLine)
-        pen.setCapStyle(Qt.PenCapStyle.FlatCap)
-        painter.setPen(pen)
-        for i, perc in enumerate(self._percs_now):
-            ioff = i * 2 * self.arcspace + self.arcthic
-            arcsize = self.height() - ioff
-            ioff = round(ioff / 2)
-            painter.drawArc(ioff, ioff, arcsize, arcsize, round(self.arcstart * 16), round(self.arcspan * 16))
-            pen.setWidth(self.arcthic)
-            painter.setPen(pen)
-            painter.drawArc(ioff, ioff, arcsize, arcsize, round(self.arcstart * 16), round(self.arcspan * perc * 16))
-            pen.setWidth(max(round(self.arcthic / 4), 1))
-            painter.setPen(pen)
+        if self.antialias: painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, background)
+        dirty = event.region()  # skip any arcs that are entirely outside the area being repainted
+        painter.setPen(self._pen_thick)
+        for (ioff, arcsize), bounds, span in zip(geometry, self._bounds, self._spans16):
+            if dirty.intersects(bounds): painter.drawArc(ioff, ioff, arcsize, arcsize, start, span)
         painter.end()
 
 
-class ProgressArcsWidget(QWidget):
+class ProgressArcsWidget(_FontSizes, QWidget):
     pos_options = ("bottom left", "bottom right", "top right", "top left")
+    _pos_index = {pos: i for i, pos in enumerate(pos_options)}
+    __slots__ = ('_text', '_title', 'arcpos', 'height_perc', 'arcthic_perc', 'arcthic', 'update_interval', 'arcs', 'label',
+                 'title_label', 'label_wrapper', 'timer', '_font_sizes')
 
     def __init__(self, parent: QWidget, text: str | PyCmd | JITstring,
                  percs: Sequence[Callable[[], float]] | Callable[[], Sequence[float]], percent: bool = True,
                  title: JITstring | str = None, height: float = .1, update_interval: int = 1000,
-                 arccol: QColor = None, arcthic: float = 0.6, arcpos: str = "top left"):
+                 arccol: QColor = None, arcthic: float = 0.6, arcpos: str = "top left", antialias: bool = True):
         """A widget that displays percentage values as arcs around some text - or a JITstring, for dynamic text.
         :param parent: the parent widget of this widget, usually the main window.
         :param text: the text for the arcs to be drawn around.
@@ -316,41 +453,44 @@ class ProgressArcsWidget(QWidget):
         :param arcthic: the thickness of the arcs relative to the text height. Set to 0 to auto-match the default underline position.
         :param title: an optional title that sits above the text.
         :param arcpos: where to place the arcs; one of ["top left", "top right", "bottom left", "bottom right"]
+        :param antialias: whether to antialias the arcs. Turning it off is faster but looks rougher.
         """
         super().__init__(parent)
         self.height_perc = height
-        self.text = text
+        self._font_sizes: tuple[int, int, int] | None = None  # see font_sizes()
+        self._text = text  # see the text property
         self.update_interval = update_interval
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.do_cmds)
         self.arcthic_perc = arcthic
         self.arcthic = None
         self.arcpos = arcpos.lower()
-        if self.arcpos not in self.pos_options:
+        pos_index = self._pos_index.get(self.arcpos)
+        if pos_index is None:
             raise ValueError(f"arcpos {arcpos} is invalid: must be one of {self.pos_options}.")
         self.label_wrapper = QWidget(self)
         layout = QtWidgets.QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.setDirection(layout.Direction.BottomToTop if 'top' in arcpos else layout.Direction.TopToBottom)
+        layout.setDirection(layout.Direction.BottomToTop if 'top' in self.arcpos else layout.Direction.TopToBottom)
         self.label_wrapper.setLayout(layout)
         self.label = TextWidget(self)
         self.label.setIndent(0)
         layout.setSpacing(0)
         layout.addWidget(self.label)
         layout.addStretch(1)
-        self.title = title
+        self._title = None
 
         if title is not None:
             self.title_label = TextWidget(self)
             layout.addWidget(self.title_label)
+        self.title = title
 
-        arcstart = 90 * self.pos_options.index(self.arcpos)
+        arcstart = 90 * pos_index
 
-        self.arcs = ArcsWidget(self, percs, percent, 0, None, arccol, 0, arcstart)
+        self.arcs = ArcsWidget(self, percs, percent, 0, None, arccol, 0, arcstart, antialias=antialias)
 
         self.label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom)
         self.label.setWordWrap(True)
-        if self.update_interval: self.timer.start(self.update_interval)
+        self.text = text
+        self.timer = WidgetTimer(self.do_cmds, self.update_interval, start=bool(self.update_interval))
         self.adjustSize()
         self.do_cmds()
 
@@ -360,13 +500,13 @@ class ProgressArcsWidget(QWidget):
         newdims = a0.size()
         newdims.setHeight(height)
         self.setMinimumHeight(height)
-        fonth = self.fontMetrics().height()
+        fonth, ls, underline = self.font_sizes()
         if self.arcthic_perc == 0.:
-            arcthic = (fonth - self.fontMetrics().underlinePos()) / 2
+            arcthic = (fonth - underline) / 2
         else:
             arcthic = fonth * self.arcthic_perc
 
-        arcsize = newdims.height() - round(max((self.fontMetrics().lineSpacing() - arcthic) / 2, 0))
+        arcsize = newdims.height() - round(max((ls - arcthic) / 2, 0))
         offset = round(arcsize / 2)
         yoff = offset if "top" in self.arcpos else 0
         xoff = offset if "left" in self.arcpos else 0
@@ -374,7 +514,6 @@ class ProgressArcsWidget(QWidget):
 
         self.arcs.setFixedSize(arcsize, arcsize)
         if self.title:
-            ls = self.fontMetrics().lineSpacing()
             self.label_wrapper.setGeometry(xoff, max(yoff - ls, 0), newdims.width() - offset, newdims.height() - offset + ls)
 
         ypos = yoff if yoff != 0 else newdims.height() - offset
@@ -382,14 +521,36 @@ class ProgressArcsWidget(QWidget):
         self.arcs.arcthic = round(arcthic)
         self.arcs.center_at(xpos, ypos)
 
+    @property
+    def text(self) -> str | PyCmd | JITstring:
+        return self._text
+
+    @text.setter
+    def text(self, text: str | PyCmd | JITstring) -> None:
+        self._text = text
+        if isinstance(text, str): self.label.setText(text)  # static, so set here instead of in every do_cmds
+
+    @property
+    def title(self) -> JITstring | str | None:
+        return self._title
+
+    @title.setter
+    def title(self, title: JITstring | str | None) -> None:
+        if not hasattr(self, 'title_label'): title = None  # created without a title, so there's no label to show it in
+        self._title = title
+        if isinstance(title, str): self.title_label.setText(title)  # likewise
+
     def do_cmds(self):
-        self.label.setText(str(self.text))
-        if hasattr(self, 'title_label'): self.title_label.setText(str(self.title))
-        self.arcs.do_cmds()
-        self.update()
+        # only dynamic text needs rendering each update. TextWidget skips the relayout if the result hasn't changed
+        if not isinstance(self._text, str): self.label.setText(str(self._text))
+        if self._title is not None and not isinstance(self._title, str): self.title_label.setText(str(self._title))
+        self.arcs.do_cmds()  # the labels and arcs schedule their own repaints, nothing else here needs redrawing
 
 
 class ProgressBarWidget(QWidget):
+    __slots__ = ('barcol', 'bgcol', '_bar_brush', '_progress', '_last_px', '_rad', '_bg_pixmap', 'squareness', 'perc', 'update_interval',
+                 'timer')
+
     def __init__(self, parent: QWidget, perc: Callable[[], float] = None, max_height: int = None,
                  update_interval: int = None, barcol: QColor = None, bgcol: QColor = None, squareness: float = 3):
         """A linear progress bar that can be manually updated or given a command and an update interval for automatic updates.
@@ -407,7 +568,11 @@ class ProgressBarWidget(QWidget):
         self.setMinimumHeight(3)  # lowest pixel count that can still be rounded
         self.barcol = QColor(barcol) if barcol else self.palette().light().color()
         self.bgcol = QColor(bgcol) if bgcol is not None else self.palette().window().color()
+        self._bar_brush = QBrush(self.barcol)  # built once rather than converted from the color every paint
         self._progress: float = 0
+        self._last_px: int | None = None  # width of the bar as last painted
+        self._rad = 0  # corner radius, see resizeEvent()
+        self._bg_pixmap: QPixmap | None = None  # the unfilled bar, see _background()
         self.squareness = squareness
         pol = self.sizePolicy()
         pol.setHorizontalStretch(255)  # max stretch
@@ -416,9 +581,7 @@ class ProgressBarWidget(QWidget):
         if perc is not None: self.perc = perc
         if update_interval is not None:
             self.update_interval = update_interval
-            self.timer = QTimer()
-            self.timer.timeout.connect(self.set_progress)
-            self.timer.start(self.update_interval)
+            self.timer = WidgetTimer(self.set_progress, self.update_interval)
         self.set_progress(0)
 
     def set_progress(self, perc: float = None):
@@ -427,148 +590,47 @@ class ProgressBarWidget(QWidget):
         """
         if perc is None: perc = self.perc()  # will fail if you don't provide a percentage in constructor or argument
         self._progress = min(100., max(0., perc))  # force progress to stay between 0 and 1
+        if round(self.width() * self._progress) == self._last_px: return  # bar wouldn't move a pixel, e.g. when paused
         self.update()
 
+    def resizeEvent(self, a0: QResizeEvent) -> None:
+        super().resizeEvent(a0)
+        self._rad = round(a0.size().height()/self.squareness)
+        self._bg_pixmap = None
+        # an opaque square bar covers every pixel, so Qt can skip painting whatever is behind it
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, self.bgcol.alpha() == 255 and self._rad == 0)
+
+    def _background(self) -> QPixmap:
+        """The unfilled bar, rendered into a pixmap that's reused until the widget is resized."""
+        dpr = self.devicePixelRatioF()
+        if self._bg_pixmap is None or self._bg_pixmap.devicePixelRatioF() != dpr:
+            pixmap = QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self.bgcol)
+            painter.drawRoundedRect(0, 0, self.width(), self.height(), self._rad, self._rad)
+            painter.end()
+            self._bg_pixmap = pixmap
+        return self._bg_pixmap
+
     def paintEvent(self, event):
-        w, h = self.width(), self.height()
-        rad = round(h/self.squareness)
+        w, h, rad = self.width(), self.height(), self._rad
+        background = self._background()
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, background)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        path = QPainterPath()
-        path.addRoundedRect(0, 0, w, h, rad, rad)
-        painter.fillPath(path, self.bgcol)
-        path = QPainterPath()
-        path.addRoundedRect(0, 0, w * self._progress, h, rad, rad)
-        painter.fillPath(path, self.barcol)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._bar_brush)
+        self._last_px = round(w * self._progress)
+        painter.setClipRect(0, 0, self._last_px, h)  # the same rounded rect, cut off at the progress
+        painter.drawRoundedRect(0, 0, w, h, rad, rad)
 
         painter.end()
 
 
-class GraphWidget(pg.PlotWidget):
-    def __init__(self, parent: QWidget, title: JITstring | str, getdata: Callable[[], float] | Callable[[], Sequence[float]],
-                 height: int = -1, update_interval: int = 500, time_span: int = 60000, yrange: tuple[float, float] | None = (0, 100),
-                 ylabel_str_fn: Callable[[float], str] = str, linecolor=None,
-                 linecolors: None | Sequence = None, linewidth: float = None, lines: int = 1):
-        """
-        A widget showing a graph with time as the x-axis and a title.
-        :param parent: the parent widget of this widget, usually the main window.
-        :param title: the title for the graph.
-        :param getdata: a function or command that returns numerical data.
-        :param height: the height of the widget in pixels. Set to None for responsive, and -1 to automatically set fixed height (default).
-        :param update_interval: how often (in ms) the graph should update.
-        :param time_span: the range in ms for the x-axis.
-        :param yrange: the range for the y-axis, as a tuple with (bottom, top).
-        :param ylabel_str_fn: a function returning the labels for the y-axis. Must take a y value and return a str.
-        :param linecolor: the color of the graph's line. Can be (R,G,B,[A]) tuple (values from 0-255), "#RGB" or "#RRGGBBAA" hex strings, QColor, etc.
-            See documentation for pyqtgraph.mkColor() for all options. Leave as None to use the parent widget's default color.
-        :param linecolors: can only use if lines > 1 and linecolor is None. Must be a list containing colors in the same format as linecolor,
-            in the same order as the data returned by getdata.
-        :param linewidth: the width of the line.
-        :param lines: how many lines to be drawn - if greater than 1, getdata must return a list of the multiple line data.
-        """
-        super().__init__(parent=None, background=None)
-        self.setStyleSheet("background-color:transparent;")
-        if height == -1: height = round(parent.screen().availableGeometry().height()/10)
-        if height is not None: self.setFixedHeight(height)
-        self.graph_title = title
-        default_color = self.palette().window().color()  # use parent palette because the PlotWidget sets its own
-        text_color = self.palette().windowText().color()
-        if linecolor is None and linecolors is None: linecolor = default_color
-        elif linecolors is not None:
-            if linecolor is not None:
-                raise AssertionError("linecolor and linecolors arguments to GraphWidget cannot both be given; change one to None.")
-            if lines == 1:
-                raise AssertionError(f"linecolors argument to GraphWidget can only be used with multiple lines - you gave lines={lines}")
-        self.xs = np.arange(0, time_span, update_interval)
-        self.ys = np.zeros(self.xs.shape if lines == 1 else (lines, self.xs.shape[0]), np.float64)
-        self.update_interval = update_interval
-        self.getdata = getdata
-        self.lines = lines
-        self.setTitle(title, size=f"{self.fontInfo().pixelSize()}px", color=text_color)
-        self.getPlotItem().titleLabel.item.setFont(self.font())
-        bott = self.getAxis('bottom')
-        bott.setStyle(showValues=False, tickLength=0, tickAlpha=0)
-        bott.setPen(color=default_color)
-        left = self.getAxis('left')
-        left.setStyle(tickLength=0, tickAlpha=0, hideOverlappingLabels=False, tickFont=self.font())
-        left.setPen(color=default_color)
-        left.setTextPen(color=text_color)
-        self.setXRange(0, time_span, padding=0)  # method is overloaded by pg.ViewBox one at runtime, ignore IDE warning
-        if yrange:
-            dy = yrange[1] - yrange[0]
-            num_ticks = 5
-            tick_offset = 0.06  # % of y-axis to move the tick labels upwards by (causes imprecision in the middle labels)
-            tickstrs = [ylabel_str_fn(i/(num_ticks - 1) * dy) for i in range(num_ticks)]
-            ticks = [(i * (1 - tick_offset) / (num_ticks - 1) + tick_offset) * dy for i in range(num_ticks)]
-            self.getAxis('left').setTicks([list(zip(ticks, tickstrs)), []])
-            self.setYRange(*yrange, padding=0)
-
-        if lines == 1:
-            pen = pg.mkPen(color=linecolor) if linewidth is None else pg.mkPen(color=linecolor, width=linewidth)
-            self.data_line = self.plot(self.xs, self.ys, pen=pen)
-        else:
-            self.data_lines = self.multiDataPlot(x=self.xs, y=self.ys)
-            if linecolor is not None:
-                pen = pg.mkPen(color=linecolor) if linewidth is None else pg.mkPen(color=linecolor, width=linewidth)
-            for i, line in enumerate(self.data_lines):
-                if linecolors is not None:
-                    pen = pg.mkPen(color=linecolors[i]) if linewidth is None else pg.mkPen(color=linecolors[i], width=linewidth)
-                line.setPen(pen)
-        self.timer = QTimer()
-        self.timer.setInterval(update_interval)
-        self.timer.timeout.connect(self.update_plot_data)
-        self.timer.start()
-
-    def update_plot_data(self):
-        if self.lines == 1:
-            self.ys = np.roll(self.ys, -1)
-            self.ys[-1] = float(self.getdata())
-            self.data_line.setData(self.xs, self.ys)
-        else:
-            data = self.getdata()
-            self.ys = np.roll(self.ys, -1, axis=1)
-            self.ys[:, -1] = data
-            for i, y in enumerate(self.ys):
-                self.data_lines[i].setData(self.xs, y)
-
-
-class VisualizerWidget(pg.PlotWidget):
-    def __init__(self, parent: QWidget, getdata: Callable[[], Sequence[float]], yrange: tuple = None, linecolor=None,
-                 linewidth: float = None, update_interval: int = 500):
-        """A mirrored line graphing the output of getdata with no axes, labels, or title. Meant to be used in other widgets.
-        :param parent: the parent widget of this widget.
-        :param getdata: a function or PyCmd that returns a list of floats. The length of the list must be the same each call.
-        :param yrange: the range for the y-axis, as a tuple with (bottom, top).
-        :param linecolor: the color of the graph's line. Can be (R,G,B,[A]) tuple (values from 0-255), "#RGB" or "#RRGGBBAA" hex strings, QColor, etc.
-            See documentation for pyqtgraph.mkColor() for all options. Leave as None to use the parent widget's default color.
-        :param linewidth: the width of the line.
-        :param update_interval: how often get_data should be called and the graph updated."""
-        super().__init__(parent)
-        if linecolor is None: linecolor = self.palette().window().color()
-        ys = np.array(getdata())
-        self.xs = np.arange(0, len(ys))
-        pen = pg.mkPen(color=linecolor) if linewidth is None else pg.mkPen(color=linecolor, width=linewidth)
-        self.getdata = getdata
-        self.update_interval = 500
-        self.setStyleSheet("background-color: transparent;")
-        for axis in ('bottom', 'left'):
-            self.hideAxis(axis)
-
-        self.setXRange(0, self.xs[-1], padding=0)
-        if yrange: self.setYRange(*yrange, padding=0)
-
-        self.data_lines = self.plot(self.xs, ys, pen=pen), self.plot(self.xs, -ys, pen=pen)
-        self.timer = QTimer()
-        self.timer.setInterval(update_interval)
-        self.timer.timeout.connect(self.update_plot_data)
-        self.timer.start()
-
-    def update_plot_data(self):
-        ys = np.array(self.getdata())
-        self.data_lines[0].setData(self.xs, ys)
-        self.data_lines[1].setData(self.xs, -ys)
-
-
 class ImageWithTextWidget(QWidget):
     def __init__(self, parent: QWidget, text: str | JITstring = None, img: bytes | Callable[[], bytes] = None,
                  text_and_img: Callable[[], tuple[str, bytes]] = None, img_size: tuple[int, int] = None,
@@ -582,7 +644,7 @@ class ImageWithTextWidget(QWidget):
             and img parameters are ignored if this isn't None.
         :param img_size: a fixed size for the image in pixels. Default is dependent on how much space the image has.
         :param img_side: which side of the widget the image is on.
-        :param update_interval: the time in ms between updates - defaults to 1 hour. Set to None to disable updates.
+        :param update_interval: the time in ms between updates - defaults to 1 hour. Set to None (or -1) to disable updates.
         """
         super().__init__(parent)
         layout = QtWidgets.QHBoxLayout(self)
@@ -602,17 +664,13 @@ class ImageWithTextWidget(QWidget):
         self.setLayout(layout)
         self.adjustSize()
 
-        if update_interval != -1:
-            self.timer = QTimer()
-            self.timer.setInterval(update_interval)
-            self.timer.timeout.connect(self.do_cmds)
-            self.timer.start()
+        if update_interval not in (None, -1): self.timer = WidgetTimer(self.do_cmds, update_interval)  # -1 also disables
         self.do_cmds()
 
     def do_cmds(self):
         if self.text_and_img is None:
-            text = self.get_text if type(self.get_text) == str else self.get_text()
-            img = self.get_img if type(self.get_img) == bytes else self.get_img()
+            text = self.get_text if isinstance(self.get_text, str) else self.get_text()
+            img = self.get_img if isinstance(self.get_img, bytes) else self.get_img()
         else:
             text, img = self.text_and_img()
         self.text_label.setText(text)
@@ -621,13 +679,35 @@ class ImageWithTextWidget(QWidget):
         self.img_label.setPixmap(pixmap)
 
 
+@lru_cache(maxsize=32)
+def _split_svg(svg: str) -> list[str]:
+    """The svg split around each currentColor, so recoloring it is a single join."""
+    return svg.split('currentColor')
+
+
+@lru_cache(maxsize=64)
+def _render_svg(key: tuple[str, tuple[int, int, int], bool], width: int, height: int) -> QPixmap:
+    """Renders the svg parsed for the given ColorSvg renderer key into a pixmap of the given size. Cached, so toggling
+    hover or play/pause back and forth reuses the same pixmaps instead of re-rendering the svg."""
+    pixmap = QPixmap(width, height)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    ColorSvg._renderers[key].render(painter)
+    painter.end()
+    return pixmap
+
+
 class ColorSvg:
+    _renderers: dict[tuple[str, tuple[int, int, int], bool], QSvgRenderer] = {}  # parsed svgs by (data, rgb, aspect), shared
+
     def __init__(self, data: str, maintain_aspect=True):
         self.svg = data
         self.svg_renderer = QSvgRenderer()
         self.maintain_aspect = maintain_aspect
+        self._key = None  # the _renderers key of svg_renderer, once recolored
 
     def render(self, size: QSize) -> QPixmap:
+        if self._key is not None: return _render_svg(self._key, size.width(), size.height())
         pixmap = QPixmap(size)
         pixmap.fill(Qt.GlobalColor.transparent)
         painter = QPainter(pixmap)
@@ -636,9 +716,16 @@ class ColorSvg:
         return pixmap
 
     def recolor(self, color: QColor):
-        self.svg_renderer.load(self.svg.replace('currentColor', 'rgb({},{},{})'.format(*color.getRgb()[:3])).encode())
-        if self.maintain_aspect:
-            self.svg_renderer.setAspectRatioMode(self.svg_renderer.aspectRatioMode().KeepAspectRatio)
+        key = (self.svg, color.getRgb()[:3], self.maintain_aspect)
+        renderer = self._renderers.get(key)
+        if renderer is None:  # only parse each svg/color combination once across all icons, so toggling and new media widgets are cheap
+            renderer = QSvgRenderer()
+            renderer.load('rgb({},{},{})'.format(*key[1]).join(_split_svg(self.svg)).encode())
+            if self.maintain_aspect:
+                renderer.setAspectRatioMode(renderer.aspectRatioMode().KeepAspectRatio)
+            self._renderers[key] = renderer
+        self.svg_renderer = renderer
+        self._key = key
 
 
 class SvgIcon(QtWidgets.QLabel):
@@ -649,6 +736,7 @@ class SvgIcon(QtWidgets.QLabel):
         self.min_size = QSize(*min_size)
         self.hover = False
         self.hover_changed = True
+        self._colors = self._palette_colors()
         self.setScaledContents(False)
         pol = self.sizePolicy()
         pol.setHorizontalPolicy(pol.Policy.MinimumExpanding)
@@ -659,7 +747,7 @@ class SvgIcon(QtWidgets.QLabel):
 
     def resizeEvent(self, event: QResizeEvent = None):
         if self.hover_changed:
-            self.svg.recolor(getattr(self.palette(), 'light' if self.hover else 'window')().color())
+            self.svg.recolor(self._colors[self.hover])
             self.hover_changed = False
         self.setPixmap(self.svg.render(self.size()))
 
@@ -673,7 +761,20 @@ class SvgIcon(QtWidgets.QLabel):
         self.hover_changed = True
         self.resizeEvent()
 
+    def _palette_colors(self) -> tuple[QColor, QColor]:
+        """The (normal, hovered) icon colors from the palette, indexable by self.hover."""
+        palette = self.palette()
+        return palette.window().color(), palette.light().color()
+
+    def changeEvent(self, a0: QEvent):
+        super().changeEvent(a0)
+        if a0.type() == QEvent.Type.PaletteChange:
+            self._colors = self._palette_colors()
+            self.hover_changed = True
+            self.resizeEvent()
+
     def replace_svg(self, data: str):
+        if data == self.svg.svg: return
         self.svg.svg = data
         self.hover_changed = True
         self.resizeEvent()
@@ -683,11 +784,13 @@ class SvgButton(QtWidgets.QPushButton):
     def __init__(self, parent: QWidget, data: str, min_size=(16, 16), maintain_aspect=True):
         super().__init__(parent)
         self.svg = ColorSvg(data, maintain_aspect)
+        self._pixmap = QPixmap()  # the rendered svg, see resizeEvent()
         self.setFlat(True)
         self.min_size = QSize(*min_size)
         self.setContentsMargins(0, 0, 0, 0)
         self.hover = False
         self.hover_changed = True
+        self._colors = self._palette_colors()
         pol = self.sizePolicy()
         pol.setHorizontalPolicy(pol.Policy.MinimumExpanding)
         pol.setVerticalPolicy(pol.Policy.MinimumExpanding)
@@ -697,11 +800,27 @@ class SvgButton(QtWidgets.QPushButton):
 
     def resizeEvent(self, event: QResizeEvent = None):
         if self.hover_changed:
-            self.svg.recolor(getattr(self.palette(), 'light' if self.hover else 'window')().color())
+            self.svg.recolor(self._colors[self.hover])
             self.hover_changed = False
-        icon = QIcon(self.svg.render(self.size()))
-        self.setIcon(icon)
-        self.setIconSize(self.size())
+        self._pixmap = self.svg.render(self.size())
+        self.update()
+
+    def paintEvent(self, event):
+        # the cached icon instead of QPushButton's full label/icon layout, but keeping the style's press and focus
+        # feedback. A flat button draws no bevel otherwise, so the style option is only built when one is needed
+        down, focus = self.isDown(), self.hasFocus()
+        painter = QtWidgets.QStylePainter(self)
+        if down or focus:
+            opt = QtWidgets.QStyleOptionButton()
+            self.initStyleOption(opt)
+        if down: painter.drawPrimitive(QtWidgets.QStyle.PrimitiveElement.PE_PanelButtonCommand, opt)
+        painter.drawPixmap(0, 0, self._pixmap)
+        if focus:
+            focus_opt = QtWidgets.QStyleOptionFocusRect()
+            focus_opt.initFrom(self)
+            focus_opt.rect = self.style().subElementRect(QtWidgets.QStyle.SubElement.SE_PushButtonFocusRect, opt, self)
+            painter.drawPrimitive(QtWidgets.QStyle.PrimitiveElement.PE_FrameFocusRect, focus_opt)
+        painter.end()
 
     def enterEvent(self, event):
         self.hover = True
@@ -713,7 +832,20 @@ class SvgButton(QtWidgets.QPushButton):
         self.hover_changed = True
         self.resizeEvent()
 
+    def _palette_colors(self) -> tuple[QColor, QColor]:
+        """The (normal, hovered) icon colors from the palette, indexable by self.hover."""
+        palette = self.palette()
+        return palette.window().color(), palette.light().color()
+
+    def changeEvent(self, a0: QEvent):
+        super().changeEvent(a0)
+        if a0.type() == QEvent.Type.PaletteChange:
+            self._colors = self._palette_colors()
+            self.hover_changed = True
+            self.resizeEvent()
+
     def replace_svg(self, data: str):
+        if data == self.svg.svg: return
         self.svg.svg = data
         self.hover_changed = True
         self.resizeEvent()
@@ -735,11 +867,7 @@ class _MediaListFramework(QWidget):
         self.setLayout(layout)
         self.mediawidgets: dict[str, _MediaFramework] = {}
 
-        if update_interval is not None:
-            self.timer = QTimer()
-            self.timer.setInterval(update_interval)
-            self.timer.timeout.connect(self.update_timelines)
-            self.timer.start()
+        if update_interval is not None: self.timer = WidgetTimer(self.update_timelines, update_interval)
 
     def remove_widget(self, name: str):
         """
@@ -748,6 +876,7 @@ class _MediaListFramework(QWidget):
         """
         widget = self.mediawidgets.pop(name)
         self.layout().removeWidget(widget)
+        _cleanup_widgets.discard(widget)  # cleaned up now, so don't do it again on exit
         widget.handle_removed()
 
     def add_widget(self, widget, name: str):
@@ -760,6 +889,7 @@ class _MediaListFramework(QWidget):
         self.layout().addWidget(widget)
 
     def update_timelines(self):
+        if not self.isVisible(): return  # nothing to show the progress on
         for widget in self.mediawidgets.values():
             if widget.playing and widget.has_progress: widget.update_timeline()
 
@@ -771,6 +901,7 @@ class _MediaFramework(QWidget):
         'forward': '<svg width="24" height="19" xmlns="http://www.w3.org/2000/svg" fill="currentColor"><path d="m3.42091,2.3383c-0.98529,-0.76634 -2.42091,-0.06419 -2.42091,1.18403l0,11.95539c0,1.2482 1.43562,1.9503 2.42091,1.184l8.19299,-6.3724c0.2436,-0.1894 0.3861,-0.4807 0.3861,-0.7893l0,5.9777c0,1.2482 1.4356,1.9503 2.4209,1.184l8.193,-6.3724c0.2436,-0.1894 0.3861,-0.4807 0.3861,-0.7893c0,-0.3086 -0.1425,-0.5999 -0.3861,-0.7894l-8.193,-6.37232c-0.9853,-0.76634 -2.4209,-0.06419 -2.4209,1.18403l0,5.97769c0,-0.3086 -0.1425,-0.5999 -0.3861,-0.7894l-8.19299,-6.37232z"/></svg>',
         'backward': '<svg width="24" height="19" xmlns="http://www.w3.org/2000/svg" fill="currentColor"><path d="m9.57909,2.3383c0.98531,-0.76634 2.42091,-0.06419 2.42091,1.18403l0,5.97769l0,5.9777c0,1.2482 -1.4356,1.9503 -2.42091,1.184l-8.19303,-6.3724c-0.24359,-0.1894 -0.38606,-0.4807 -0.38606,-0.7893c0,-0.3086 0.14247,-0.5999 0.38606,-0.7894l8.19303,-6.37232z"/><path d="m12,9.50002c0,0.3086 0.1425,0.5999 0.3861,0.7893l8.193,6.3724c0.9853,0.7663 2.4209,0.0642 2.4209,-1.184l0,-11.95539c0,-1.24822 -1.4356,-1.95037 -2.4209,-1.18403l-8.193,6.37232c-0.2436,0.1895 -0.3861,0.4808 -0.3861,0.7894z"/></svg>'
     }
+    _playpause_icons = (media_icons['play'], media_icons['pause'])  # indexed by self.playing
 
     def __init__(self, parent: QWidget, playername: str = None, imgsize: int = None):
         """
@@ -788,6 +919,7 @@ class _MediaFramework(QWidget):
         self.playing = False
         self.has_progress = True
         self.can_raise = False
+        register_cleanup(self)
 
         self.infolabel = TextWidget(self, alignment="Left")
         self.infolabel.setScaledContents(True)
@@ -795,18 +927,21 @@ class _MediaFramework(QWidget):
         self.infolabel.setSizePolicy(pol.Expanding, pol.Preferred)
         self.playernamelabel = TextWidget(self, alignment="Left")
         self.playernamelabel.setScaledContents(True)
-        layout = QtWidgets.QHBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        self.info_layout = QtWidgets.QVBoxLayout()
-        self.info_layout.setContentsMargins(0, 0, 0, 0)
+        for label in (self.infolabel, self.playernamelabel):  # neither needs html, so skip Qt's rich text detection/parsing
+            label.setTextFormat(Qt.TextFormat.PlainText)
+        font = self.playernamelabel.font()
+        font.setBold(True)
+        self.playernamelabel.setFont(font)
+        # one grid rather than nested box layouts: the art on the left, then rows of info, name, controls and progress
+        layout = QtWidgets.QGridLayout()
         self.setLayout(layout)
+        layout.setContentsMargins(0, 0, max(layout.horizontalSpacing(), 0), 0)  # same space on the right as after the art
         self.imglabel = QtWidgets.QLabel(self)
-        self.imglabel.setFixedSize(imgsize, imgsize)
-        self.imglabel.setScaledContents(True)
+        self.imglabel.setFixedSize(imgsize, imgsize)  # art is scaled to this once in set_art, not on every paint
         self.imglabel.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.imglabel)
-        self.info_layout.addWidget(self.infolabel)
-        self.info_layout.addWidget(self.playernamelabel)
+        layout.addWidget(self.imglabel, 0, 0, 4, 1)
+        layout.addWidget(self.infolabel, 0, 1, 1, 3)
+        layout.addWidget(self.playernamelabel, 1, 1, 1, 3)
 
         def mousePressEvent(a0):
             if self.can_raise and a0.button() == Qt.MouseButton.LeftButton: self.raise_player()
@@ -814,42 +949,32 @@ class _MediaFramework(QWidget):
         self.imglabel.mousePressEvent = mousePressEvent
         self.playernamelabel.mousePressEvent = mousePressEvent
 
-        self.ctrllayout = QtWidgets.QHBoxLayout()
-
         self.buttons = []
-        for state, action in zip(('backward', 'play', 'forward'), (self.do_prev, self.do_playpause, self.do_next)):
+        for col, state, action in zip((1, 2, 3), ('backward', 'play', 'forward'), (self.do_prev, self.do_playpause, self.do_next)):
             but = SvgButton(self, self.media_icons[state])
             but.setMaximumHeight(max_button_height)
             but.clicked.connect(action)
             self.buttons.append(but)
-            self.ctrllayout.addWidget(but)
-
+            layout.addWidget(but, 2, col)
+            layout.setColumnStretch(col, 1)
 
         self.pbar = ProgressBarWidget(self, max_height=int(self.height() // 2.5))
         pol = self.pbar.sizePolicy()
         pol.setRetainSizeWhenHidden(True)
         self.pbar.setSizePolicy(pol)
-
-        self.info_layout.addLayout(self.ctrllayout)
-        self.info_layout.addWidget(self.pbar)
-        layout.addLayout(self.info_layout)
-        self.info_layout.setStretchFactor(self.ctrllayout, 5)
-        self.info_layout.setStretchFactor(self.pbar, 1)
-
-        placeholder = QWidget()  # to make the spacing equal - otherwise have to set spacing to 0 and adjust content margins
-        placeholder.setMaximumSize(0, 0)
-        layout.addWidget(placeholder)
+        layout.addWidget(self.pbar, 3, 1, 1, 3)
+        layout.setRowStretch(2, 5)
+        layout.setRowStretch(3, 1)
 
         self.setFixedHeight(imgsize)
-        self.playernamelabel.setText(f"<b>{self.playername}</b>")
+        self.playernamelabel.setText(self.playername)
         self.update()
 
     def _redraw_playpause_button(self):
         """
         Sets the icon on the play/pause button depending on the value of self.playing
         """
-        self.buttons[1].replace_svg(self.media_icons['pause' if self.playing else 'play'])
-        self.update()
+        self.buttons[1].replace_svg(self._playpause_icons[self.playing])  # the button repaints itself
 
     def do_next(self):
         """
@@ -889,19 +1014,35 @@ class _MediaFramework(QWidget):
         """
         raise NotImplementedError
 
+    def set_art(self, art: QPixmap):
+        """
+        Shows the given album art, scaled once to the image size.
+        :param art: the album art to show.
+        """
+        dpr = self.imglabel.devicePixelRatioF()
+        art = art.scaled(self.imglabel.size() * dpr, Qt.AspectRatioMode.IgnoreAspectRatio,
+                         Qt.TransformationMode.SmoothTransformation)
+        art.setDevicePixelRatio(dpr)
+        self.imglabel.setPixmap(art)
+        self.imglabel.show()
+
     def update_info(self, title: str, artist: str):
         """
         Displays the title/artist info. Should be called whenever any of this info changes.
         """
-        self.infolabel.setText(f"{title}<br>{artist}")
+        text = f"{title}\n{artist}"
+        if text == self.displaytext: return
+        self.displaytext = text
+        self.infolabel.setText(text)
 
     def update_player(self, playername: str):
         """
         Call when you want the player name updated for whatever reason.
         :param playername: the new playername to set.
         """
+        if playername == self.playername: return
         self.playername = playername
-        self.playernamelabel.setText(f"<b>{self.playername}</b>")
+        self.playernamelabel.setText(self.playername)
 
     def progressupdate(self, perc: float):
         """
@@ -935,6 +1076,7 @@ class _MediaFramework(QWidget):
 class NotificationWidgetFramework(QWidget):
     def __init__(self, parent):
         super().__init__(parent)
+        register_cleanup(self)
 
 
 class HrWidget(QtWidgets.QFrame):
@@ -967,16 +1109,28 @@ class TextWidget(QtWidgets.QLabel):
         """
         super().__init__(parent)
         self.setWordWrap(wordwrap)
-        self.setAlignment(getattr(Qt.AlignmentFlag, "Align" + alignment))
+        align = _alignments.get(alignment)
+        if align is None: raise ValueError(f"alignment {alignment} is invalid: must be one of {tuple(_alignments)}.")
+        self.setAlignment(align)
         self.get_text = text
-        if update_interval is not None:
-            self.timer = QTimer()
-            self.timer.timeout.connect(self.do_cmds)
-            self.timer.start(update_interval)
+        if update_interval is not None: self.timer = WidgetTimer(self.do_cmds, update_interval)
         self.do_cmds()
 
+    @property
+    def get_text(self) -> JITstring | str:
+        return self._get_text
+
+    @get_text.setter
+    def get_text(self, text: JITstring | str) -> None:
+        self._get_text = text  # bind how to render it now, rather than dispatching through str() every update
+        self._render = text.render if isinstance(text, JITstring) else lambda: str(text)
+
+    def setText(self, a0: str) -> None:
+        if a0 == self.text(): return  # skip the label relayout when the text hasn't changed
+        super().setText(a0)
+
     def do_cmds(self):
-        self.setText(str(self.get_text))
+        self.setText(self._render())
 
 
 def html_table(array: Sequence[Sequence], title='', style: str = "border-collapse: collapse;",
@@ -990,12 +1144,85 @@ def html_table(array: Sequence[Sequence], title='', style: str = "border-collaps
     :param tstyle: the css style element for the title
     :return: a string containing the HTML data for the table.
     """
-    table = f'<div style="{tstyle}">{title}</div>' if title else ''
-    table += f'<table width=100% style="{style}">'
-    for row in array:
-        table += f'<tr><td>{row[0]}</td><td style="{right_td_style}">{row[1]}</td></tr>'
-    table += '</table>'
-    return table
+    header = f'<div style="{tstyle}">{title}</div>' if title else ''
+    row_mid = f'</td><td style="{right_td_style}">'  # same for every row, so only format it once
+    rows = ''.join([f'<tr><td>{row[0]}{row_mid}{row[1]}</td></tr>' for row in array])
+    return f'{header}<table width=100% style="{style}">{rows}</table>'
+
+
+def html_table_from_columns(labels: Sequence, values: Sequence, title='', style: str = "border-collapse: collapse;",
+                            right_td_style: str = "text-align: right;", tstyle: str = "text-align: center;") -> str:
+    """
+    The same as html_table, but takes the two columns as separate sequences instead of a list of rows. Saves
+    zipping the data into row lists first when it's already stored by column.
+    :param labels: the contents of the left column.
+    :param values: the contents of the right column, in the same order as labels.
+    :param title: the title of the table.
+    :param style: a CSS style for the table element.
+    :param right_td_style: a CSS style to be given to the right cells.
+    :param tstyle: the css style element for the title
+    :return: a string containing the HTML data for the table.
+    """
+    return html_table(zip(labels, values), title, style, right_td_style, tstyle)
+
+
+def compile_table_renderer(title='', style: str = "border-collapse: collapse;", right_td_style: str = "text-align: right;",
+                           tstyle: str = "text-align: center;") -> Callable[[Sequence[Sequence]], str]:
+    """
+    Creates a function equivalent to html_table with the given title and styles already applied. All the markup that
+    doesn't depend on the table's contents is formatted once here, so each call only fills in the cells.
+    :param title: the title of the table.
+    :param style: a CSS style for the table element.
+    :param right_td_style: a CSS style to be given to the right cells.
+    :param tstyle: the css style element for the title
+    :return: a function that takes the array argument of html_table and returns the table's HTML.
+    """
+    start = (f'<div style="{tstyle}">{title}</div>' if title else '') + f'<table width=100% style="{style}">'
+    row_mid = f'</td><td style="{right_td_style}">'
+
+    def render(array: Sequence[Sequence]) -> str:
+        return start + ''.join([f'<tr><td>{row[0]}{row_mid}{row[1]}</td></tr>' for row in array]) + '</table>'
+    return render
+
+
+class HTMLTableRenderer:
+    def __init__(self, style: str = "border-collapse: collapse;", right_td_style: str = "text-align: right;",
+                 tstyle: str = "text-align: center;"):
+        """
+        A reusable version of html_table for tables that are rebuilt on every update. Remembers the rows from the
+        previous call, so only rows whose contents changed since then are formatted again.
+        :param style: a CSS style for the table element.
+        :param right_td_style: a CSS style to be given to the right cells.
+        :param tstyle: the css style element for the title
+        """
+        self.style = style
+        self.right_td_style = right_td_style
+        self.tstyle = tstyle
+        self._row_cache: dict[tuple, str] = {}
+        self._style_key = None
+
+    def __call__(self, array: Sequence[Sequence], title='') -> str:
+        """
+        Creates a 2 column HTML table out of the provided info, same as html_table.
+        :param array: a list of lists where each secondary list has two rows. Cell values must be hashable (str, int, etc).
+        :param title: the title of the table.
+        :return: a string containing the HTML data for the table.
+        """
+        style_key = (self.style, self.right_td_style)
+        last_rows = self._row_cache if style_key == self._style_key else {}  # styles changed, so nothing can be reused
+        self._style_key = style_key
+        row_mid = f'</td><td style="{self.right_td_style}">'
+        rows = {}  # only keep this call's rows, so the cache can't grow past the size of the table
+        html = []
+        for row in array:
+            key = (row[0], row[1])
+            tr = rows.get(key) or last_rows.get(key)
+            if tr is None: tr = f'<tr><td>{row[0]}{row_mid}{row[1]}</td></tr>'
+            rows[key] = tr
+            html.append(tr)
+        self._row_cache = rows
+        header = f'<div style="{self.tstyle}">{title}</div>' if title else ''
+        return f'{header}<table width=100% style="{self.style}">{"".join(html)}</table>'
 
 
 def start() -> None:
@@ -1017,36 +1244,215 @@ def start() -> None:
     if not _use_async:
         _app.exec()
     else:
-        if qtinter is None:
+        if qasync is None and qtinter is None:
             raise ImportError(
                 "The page you're trying to run requires async functionality, but you don't have it installed. To use this page, reinstall pywidgets with the [async] option, like 'pip install pywidgets_file_path[async]"
             )
-        with qtinter.using_asyncio_from_qt():
-            _app.exec()
+        if qasync is not None:
+            event_loop = qasync.QEventLoop(_app)
+            asyncio.set_event_loop(event_loop)
+            with event_loop: event_loop.run_forever()  # runs _app.exec(), returns once the app quits
+        else:
+            with qtinter.using_asyncio_from_qt():
+                _app.exec()
+
+
+def _cancel_task(task) -> None:
+    """The default done callback for schedule(), defined once instead of a new lambda per call."""
+    task.cancel()
 
 
 def schedule(coro, callback=None):
-    if loop is None:
+    _loop = loop  # one global lookup
+    if _loop is None:
         raise AssertionError(
             "One of your widgets is trying to use async functionality, which is disabled. \
-            Make sure qtinter is installed and that use_async is True in your Window initialization."
+            Make sure qasync or qtinter is installed and that use_async is True in your Window initialization."
         )
-    task = loop.create_task(coro)
-    callback = callback if callback is not None else lambda task: task.cancel()
-    task.add_done_callback(callback)
+    task = _loop.create_task(coro)
+    task.add_done_callback(_cancel_task if callback is None else callback)
     return task
 
 
 def call_threadsafe(fn: Callable, *args, context=None) -> None:
-    if loop is None:
+    _loop = loop  # one global lookup
+    if _loop is None:
         raise AssertionError(
             "One of your widgets is trying to use async functionality, which is disabled. \
-            Make sure qtinter is installed and that use_async is True in your Window initialization."
+            Make sure qasync or qtinter is installed and that use_async is True in your Window initialization."
         )
-    loop.call_soon_threadsafe(fn, *args, context=context)
+    if context is None: _loop.call_soon_threadsafe(fn, *args)  # the usual case, skip passing the keyword
+    else: _loop.call_soon_threadsafe(fn, *args, context=context)
+
+
+class _Ticker(QObject):
+    """The timeout signal for one interval, emitted every [multiple] ticks of the shared timer driving it."""
+    timeout = pyqtSignal()
+
+    def __init__(self, multiple: int, hub: QTimer):
+        super().__init__()
+        self.multiple = multiple
+        self.hub = hub  # the _HubTimer driving this ticker
+
+
+class _HubTimer(QTimer):
+    """A shared QTimer that drives the tickers of every interval that's a multiple of its own. See shared_timer()."""
+    def __init__(self, interval: int):
+        super().__init__()
+        self.setInterval(interval)
+        self.tickers: list[_Ticker] = []
+        self.ticks = 0
+        self.timeout.connect(self._tick)
+
+    def _tick(self):
+        self.ticks += 1
+        for ticker in self.tickers:
+            if self.ticks % ticker.multiple == 0: ticker.timeout.emit()
+
+
+def shared_timer(interval: int) -> _Ticker:
+    """Returns an object whose timeout signal fires every [interval] ms, creating it if needed. Widgets that update at
+    the same interval all connect to the same signal, and intervals that are multiples of each other are driven by the
+    same QTimer, so they're all updated in one wakeup rather than one each.
+    :param interval: the time in ms between timeouts. 0 fires whenever the event loop is idle, like a QTimer, and always
+        gets a timer of its own.
+    """
+    if interval < 0: raise ValueError(f"timer interval {interval} is invalid: must be 0 or more ms.")
+    ticker = _tickers.get(interval)
+    if ticker is not None: return ticker
+    # only positive intervals are merged - 0 would divide everything and can't be divided into
+    base = next((b for b in _shared_timers if b and interval and interval % b == 0), None)
+    if base is None:  # nothing running divides this interval, so start a timer for it
+        base = interval
+        timer = _HubTimer(interval)
+        for other in [b for b in _shared_timers if b and interval and b % interval == 0]:  # and take over any it divides
+            old = _shared_timers.pop(other)
+            old.stop()
+            for moved in old.tickers:
+                moved.multiple *= other // interval
+                moved.hub = timer
+            timer.tickers += old.tickers
+        timer.start()
+        _shared_timers[base] = timer
+    ticker = _tickers[interval] = _Ticker(interval // base if base else 1, _shared_timers[base])
+    _shared_timers[base].tickers.append(ticker)
+    return ticker
+
+
+class WidgetTimer:
+    """A widget's handle on its shared_timer() interval, with the start/stop/interval methods of the QTimer each widget
+    used to own. Stopping it only disconnects that widget; the shared QTimer keeps running for the others, and only
+    stops once nothing is connected to it."""
+    __slots__ = ('slot', 'widget', '_interval', '_active', '_paused', '__weakref__')
+
+    def __init__(self, slot: Callable[[], None], interval: int, start: bool = True, widget: QWidget = None):
+        """
+        :param slot: the method to call on every timeout.
+        :param interval: the time in ms between timeouts. Can be None if start is False, as long as an interval is
+            given to start() or setInterval() before starting.
+        :param start: whether to start connected, like calling start() right away.
+        :param widget: the widget this timer updates, so its Window can pause it while hidden. Defaults to the object
+            slot is bound to, if that's a widget. Without one, the timer is never paused.
+        """
+        self.slot = slot
+        if widget is None:
+            owner = getattr(slot, '__self__', None)  # plain functions, lambdas and partials aren't bound to anything
+            if isinstance(owner, QWidget): widget = owner
+        self.widget = widget
+        self._interval = interval
+        self._active = False
+        self._paused = False  # set by the Window while it's hidden, see pause()
+        _widget_timers.add(self)
+        if start: self.start()
+
+    def _connect(self, connect: bool) -> None:
+        ticker = shared_timer(self._interval)
+        hub = ticker.hub
+        if connect:
+            ticker.timeout.connect(self.slot)
+            if not hub.isActive(): hub.start()
+        else:
+            ticker.timeout.disconnect(self.slot)
+            if not any(t.receivers(t.timeout) for t in hub.tickers): hub.stop()  # no wakeups with nothing to update
+
+    def start(self, msec: int = None) -> None:
+        if msec is None and self._interval is None:
+            raise ValueError("This timer has no interval yet - use start(msec), or call setInterval() first.")
+        self.stop()
+        if msec is not None: self._interval = msec
+        self._active = True
+        if not self._paused: self._connect(True)
+
+    def stop(self) -> None:
+        if self._active and not self._paused: self._connect(False)
+        self._active = False
+
+    def pause(self, paused: bool) -> None:
+        """Unlike stop(), a paused timer that was active starts again on pause(False)."""
+        if paused == self._paused: return
+        self._paused = paused
+        if self._active: self._connect(not paused)
+
+    def setInterval(self, msec: int) -> None:
+        if self._active: self.start(msec)
+        else: self._interval = msec
+
+    def interval(self) -> int: return self._interval
+
+    def isActive(self) -> bool: return self._active
+
+
+def cached_pen(color: QColor, width: int) -> QPen:
+    """Returns a solid, flat-capped QPen of the given color and width, shared between all widgets that ask for it.
+    Don't modify the returned pen - copy it with QPen(pen) first.
+    :param color: the color of the pen as a Qt color.
+    :param width: the width of the pen in pixels.
+    """
+    key = (QColor(color).rgba(), width)
+    pen = _pen_cache.get(key)
+    if pen is None:
+        pen = QPen(QColor(color), width, Qt.PenStyle.SolidLine)
+        pen.setCapStyle(Qt.PenCapStyle.FlatCap)
+        pen.setCosmetic(True)  # widths are in device pixels already, so skip transforming them
+        _pen_cache[key] = pen
+    return pen
+
+
+def register_cleanup(widget: QWidget) -> None:
+    """Has the given widget's handle_removed() method called when the Window exits. Widgets added to the Window with
+    add_widget(s) are registered automatically; nested or custom widgets with cleanup to do should call this themselves.
+    :param widget: the widget to clean up. Only weakly referenced, so it doesn't keep deleted widgets alive.
+    """
+    _cleanup_widgets.add(widget)
 
 
 def run_on_app_start(f: Callable, *args, **kwargs) -> None:
     """Takes the given function/method/PyCmd and runs it immediately once the QApplication starts.
-    Just a wrapper for a single-shot QTimer to make code more readable."""
-    QTimer.singleShot(0, PyCmd(f, *args, **kwargs))
+    All the functions queued before the app starts are run in order by one single-shot QTimer."""
+    if not _startup_queue: QTimer.singleShot(0, _run_startup_queue)  # otherwise one is already pending
+    _startup_queue.append(PyCmd(f, *args, **kwargs))
+
+
+def _run_startup_queue() -> None:
+    queue, _startup_queue[:] = _startup_queue[:], []  # anything queued while these run gets its own pass
+    for f in queue:
+        try: f()
+        except Exception:  # one failing callback shouldn't keep the rest from running
+            logging.getLogger(__name__).exception("Startup callback %r failed", f.cmd)  # PyCmd's repr would rerun it
+
+
+_graph_widgets = ('GraphWidget', 'VisualizerWidget')
+
+
+def __getattr__(name: str):
+    # the graph widgets are kept in their own module so pyqtgraph (and numpy) are only imported when one is used.
+    # Attribute access and `from pywidgets.widgets import GraphWidget` both work, but `import *` doesn't include them -
+    # listing them in __all__ would import pyqtgraph on every star import, which is what this avoids
+    if name in _graph_widgets:
+        from pywidgets import graphwidgets
+        return getattr(graphwidgets, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_graph_widgets])  # so the lazy graph widgets still show up for dir() and autocomplete
@@ -147,8 +147,7 @@ class MediaWidget(_MediaFramework):
             if self.albumart is None:
                 self.imglabel.hide()
                 return
-            self.imglabel.setPixmap(self.albumart)
-            if self.imglabel.isHidden(): self.imglabel.show()
+            self.set_art(self.albumart)
 
     def do_next(self, *args):
         """